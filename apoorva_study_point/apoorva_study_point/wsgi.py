@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'apoorva_study_point.settings')
 
 application = get_wsgi_application()
+
+# Import the URLconf and build the resolver's lookup tables while the process
+# starts rather than on its first request (shared across forks with --preload)
+if not settings.DEBUG:
+    get_resolver()._populate()
@@ -1,7 +1,23 @@
 from django.contrib import admin
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import Student, Shift, Attendance, FeeTransaction, FeeConfiguration, UserProfile
+from .models import Student, Shift, Attendance, FeeTransaction, FeeConfiguration, UserProfile, FEE_CONFIG_CACHE_KEY
+
+class ListOnlyChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.list_only)
+
+class ListOnlyMixin:
+    """Select only the list_only columns on the changelist; change forms still load full rows"""
+    list_only = ()
+
+    def get_changelist(self, request, **kwargs):
+        if self.list_only:
+            return ListOnlyChangeList
+        return super().get_changelist(request, **kwargs)
 
 # Inline admin for UserProfile
 class UserProfileInline(admin.StackedInline):
@@ -25,12 +41,13 @@ class ShiftAdmin(admin.ModelAdmin):
     ordering = ['name']
 
 @admin.register(Student)
-class StudentAdmin(admin.ModelAdmin):
+class StudentAdmin(ListOnlyMixin, admin.ModelAdmin):
     list_display = ['name', 'contact', 'get_shifts_display', 'fee_status', 'total_due_amount', 'date_enrolled']
+    list_only = ['name', 'contact', 'fee_status', 'total_due_amount', 'date_enrolled']
     list_filter = ['fee_status', 'enrolled_shifts', 'date_enrolled', 'is_active']
     search_fields = ['name', 'contact']
     filter_horizontal = ['enrolled_shifts']
-    readonly_fields = ['date_enrolled', 'single_shift_fee', 'discount_applied', 'total_due_amount']
+    readonly_fields = ['date_enrolled', 'single_shift_fee', 'discount_applied', 'total_due_amount', 'total_paid', 'last_payment_date']
     ordering = ['name']
 
     fieldsets = (
@@ -41,13 +58,22 @@ class StudentAdmin(admin.ModelAdmin):
             'fields': ('enrolled_shifts', 'date_enrolled')
         }),
         ('Fee Information', {
-            'fields': ('single_shift_fee', 'discount_applied', 'total_due_amount', 'fee_status')
+            'fields': ('single_shift_fee', 'discount_applied', 'total_paid', 'last_payment_date', 'total_due_amount', 'fee_status')
         }),
         ('Status', {
             'fields': ('is_active',)
         }),
     )
 
+    def get_queryset(self, request):
+        # Load enrolled shifts in one query for the shifts column
+        return super().get_queryset(request).prefetch_related('enrolled_shifts')
+
+    @admin.display(description='Shifts')
+    def get_shifts_display(self, obj):
+        # Reads the prefetched shifts, no query per row
+        return obj.get_shifts_display()
+
     def save_model(self, request, obj, form, change):
         super().save_model(request, obj, form, change)
         # Recalculate fees after saving
@@ -55,9 +81,11 @@ class StudentAdmin(admin.ModelAdmin):
         obj.update_fee_status()
 
 @admin.register(Attendance)
-class AttendanceAdmin(admin.ModelAdmin):
+class AttendanceAdmin(ListOnlyMixin, admin.ModelAdmin):
     list_display = ['student', 'shift', 'date', 'status', 'marked_by', 'marked_at']
     list_filter = ['status', 'shift', 'date', 'marked_at']
+    list_select_related = ['student', 'shift', 'marked_by']
+    list_only = ['date', 'status', 'marked_at', 'student__name', 'shift__name', 'marked_by__username']
     search_fields = ['student__name']
     date_hierarchy = 'date'
     ordering = ['-date', 'shift', 'student']
@@ -68,9 +96,14 @@ class AttendanceAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 @admin.register(FeeTransaction)
-class FeeTransactionAdmin(admin.ModelAdmin):
+class FeeTransactionAdmin(ListOnlyMixin, admin.ModelAdmin):
     list_display = ['student', 'amount_paid', 'payment_date', 'payment_status', 'remaining_due_after_payment', 'processed_by']
     list_filter = ['payment_status', 'payment_date', 'processed_by']
+    list_select_related = ['student', 'processed_by']
+    list_only = [
+        'amount_paid', 'payment_date', 'payment_status', 'remaining_due_after_payment',
+        'created_at', 'student__name', 'processed_by__username'
+    ]
     search_fields = ['student__name', 'transaction_id']
     date_hierarchy = 'payment_date'
     readonly_fields = ['transaction_id', 'created_at', 'remaining_due_after_payment']
@@ -103,17 +136,19 @@ class FeeConfigurationAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
     def has_add_permission(self, request):
-        # Only allow one configuration instance
-        return not FeeConfiguration.objects.exists()
+        # Only allow one configuration instance; a cached instance means it exists
+        return cache.get(FEE_CONFIG_CACHE_KEY) is None and not FeeConfiguration.objects.exists()
 
     def has_delete_permission(self, request, obj=None):
         # Don't allow deletion of configuration
         return False
 
 @admin.register(UserProfile)
-class UserProfileAdmin(admin.ModelAdmin):
+class UserProfileAdmin(ListOnlyMixin, admin.ModelAdmin):
     list_display = ['user', 'role', 'phone_number', 'created_by', 'created_at', 'is_active']
     list_filter = ['role', 'is_active', 'created_at']
+    list_select_related = ['user', 'created_by']
+    list_only = ['role', 'phone_number', 'created_at', 'is_active', 'user__username', 'created_by__username']
     search_fields = ['user__username', 'user__email', 'phone_number']
     readonly_fields = ['created_at']
     ordering = ['user__username']
@@ -0,0 +1,10 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    # Polled by the dashboard, listed first so they resolve first
+    path('dashboard/stats/', views.DashboardStatsAPIView.as_view(), name='api_dashboard_stats'),
+    path('attendance/chart/', views.AttendanceChartAPIView.as_view(), name='api_attendance_chart'),
+    path('fee/chart/', views.FeeChartAPIView.as_view(), name='api_fee_chart'),
+    path('students/search/', views.StudentSearchAPIView.as_view(), name='api_student_search'),
+]
@@ -0,0 +1,7 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('attendance/', views.ExportAttendanceView.as_view(), name='export_attendance'),
+    path('fees/', views.ExportFeesView.as_view(), name='export_fees'),
+]
@@ -1,16 +1,47 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout, Field, Fieldset, ButtonHolder, Submit, Row, Column
-from .models import Student, Attendance, FeeTransaction, FeeConfiguration, UserProfile, Shift
+from .models import (
+    Student, Attendance, FeeTransaction, FeeConfiguration, UserProfile, Shift,
+    ACTIVE_SHIFTS_CACHE_KEY, ACTIVE_SHIFTS_CACHE_TIMEOUT
+)
 
-class StudentForm(forms.ModelForm):
+def get_active_shift_choices():
+    """Return (pk, label) pairs for active shifts, cached across requests"""
+    return cache.get_or_set(
+        ACTIVE_SHIFTS_CACHE_KEY,
+        lambda: [(shift.pk, str(shift)) for shift in Shift.objects.filter(is_active=True)],
+        ACTIVE_SHIFTS_CACHE_TIMEOUT
+    )
+
+# Shared by every per-student field in BulkAttendanceForm
+ATTENDANCE_STATUS_CHOICES = tuple(Attendance.STATUS_CHOICES)
+ATTENDANCE_STATUS_WIDGET = forms.Select(attrs={'class': 'form-control form-control-sm'})
+
+class ActiveShiftChoicesMixin:
+    """Render the fields in shift_fields from cached choices instead of querying Shift"""
+    shift_fields = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        shift_choices = get_active_shift_choices()
+        for field_name in self.shift_fields:
+            field = self.fields[field_name]
+            # The queryset is still used to validate submitted values
+            empty_choice = [('', field.empty_label)] if field.empty_label is not None else []
+            field.choices = empty_choice + shift_choices
+
+class StudentForm(ActiveShiftChoicesMixin, forms.ModelForm):
     enrolled_shifts = forms.ModelMultipleChoiceField(
         queryset=Shift.objects.filter(is_active=True),
         widget=forms.CheckboxSelectMultiple,
         required=True
     )
+    shift_fields = ('enrolled_shifts',)
 
     class Meta:
         model = Student
@@ -73,7 +104,7 @@ class AttendanceForm(forms.ModelForm):
             )
         )
 
-class BulkAttendanceForm(forms.Form):
+class BulkAttendanceForm(ActiveShiftChoicesMixin, forms.Form):
     date = forms.DateField(
         widget=forms.DateInput(attrs={'type': 'date', 'class': 'form-control'})
     )
@@ -81,6 +112,7 @@ class BulkAttendanceForm(forms.Form):
         queryset=Shift.objects.filter(is_active=True),
         widget=forms.Select(attrs={'class': 'form-control'})
     )
+    shift_fields = ('shift',)
 
     def __init__(self, *args, **kwargs):
         self.students = kwargs.pop('students', [])
@@ -88,11 +120,10 @@ class BulkAttendanceForm(forms.Form):
 
         # Dynamically add attendance fields for each student
         for student in self.students:
-            field_name = f'student_{student.id}'
-            self.fields[field_name] = forms.ChoiceField(
-                choices=Attendance.STATUS_CHOICES,
+            self.fields[f'student_{student.id}'] = forms.ChoiceField(
+                choices=ATTENDANCE_STATUS_CHOICES,
                 initial='PRESENT',
-                widget=forms.Select(attrs={'class': 'form-control form-control-sm'}),
+                widget=ATTENDANCE_STATUS_WIDGET,
                 label=student.name
             )
 
@@ -196,16 +227,18 @@ class CustomUserCreationForm(UserCreationForm):
         user = super().save(commit=False)
         user.email = self.cleaned_data['email']
         if commit:
-            user.save()
-            # Create user profile
-            UserProfile.objects.create(
-                user=user,
-                role=self.cleaned_data['role'],
-                phone_number=self.cleaned_data['phone_number']
-            )
+            # Commit the user and profile together so neither exists without the other
+            with transaction.atomic():
+                user.save()
+                # Create user profile
+                UserProfile.objects.create(
+                    user=user,
+                    role=self.cleaned_data['role'],
+                    phone_number=self.cleaned_data['phone_number']
+                )
         return user
 
-class StudentSearchForm(forms.Form):
+class StudentSearchForm(ActiveShiftChoicesMixin, forms.Form):
     search_query = forms.CharField(
         max_length=100,
         required=False,
@@ -225,8 +258,9 @@ class StudentSearchForm(forms.Form):
         required=False,
         widget=forms.Select(attrs={'class': 'form-control'})
     )
+    shift_fields = ('shift_filter',)
 
-class AttendanceFilterForm(forms.Form):
+class AttendanceFilterForm(ActiveShiftChoicesMixin, forms.Form):
     date_from = forms.DateField(
         required=False,
         widget=forms.DateInput(attrs={'type': 'date', 'class': 'form-control'})
@@ -247,17 +281,19 @@ class AttendanceFilterForm(forms.Form):
         empty_label="All Students",
         widget=forms.Select(attrs={'class': 'form-control'})
     )
+    shift_fields = ('shift_filter',)
 
-class FeeTransactionFilterForm(forms.Form):
+class FeeTransactionFilterForm(ActiveShiftChoicesMixin, forms.Form):
     status_filter = forms.ChoiceField(
         choices=[('', 'All Status')] + FeeTransaction.PAYMENT_STATUS_CHOICES,
         required=False,
         widget=forms.Select(attrs={'class': 'form-control'})
     )
-    month_filter = forms.CharField(
-        max_length=7,
+    # Parsed to the first day of the month, so out-of-range months fail validation
+    month_filter = forms.DateField(
+        input_formats=['%Y-%m'],
         required=False,
-        widget=forms.TextInput(attrs={'type': 'month', 'class': 'form-control'})
+        widget=forms.DateInput(format='%Y-%m', attrs={'type': 'month', 'class': 'form-control'})
     )
     shift_filter = forms.ModelChoiceField(
         queryset=Shift.objects.filter(is_active=True),
@@ -265,3 +301,4 @@ class FeeTransactionFilterForm(forms.Form):
         empty_label="All Shifts",
         widget=forms.Select(attrs={'class': 'form-control'})
     )
+    shift_fields = ('shift_filter',)
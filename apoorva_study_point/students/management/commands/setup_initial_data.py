@@ -1,11 +1,15 @@
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from students.models import Shift, FeeConfiguration, UserProfile
+from django.core.cache import cache
+from django.db import transaction
+from students.models import Shift, FeeConfiguration, UserProfile, ACTIVE_SHIFTS_CACHE_KEY
 from datetime import time
 
 class Command(BaseCommand):
     help = 'Setup initial data for Apoorva Study Point'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('Setting up initial data...'))
 
@@ -16,67 +20,61 @@ class Command(BaseCommand):
             ('EVENING', time(17, 0), time(20, 0)),
         ]
 
-        for name, start_time, end_time in shifts_data:
-            shift, created = Shift.objects.get_or_create(
-                name=name,
-                defaults={
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'is_active': True
-                }
-            )
-            if created:
-                self.stdout.write(f'Created shift: {shift.get_name_display()}')
+        existing_shifts = set(Shift.objects.filter(
+            name__in=[name for name, start_time, end_time in shifts_data]
+        ).values_list('name', flat=True))
+        new_shifts = [
+            Shift(name=name, start_time=start_time, end_time=end_time, is_active=True)
+            for name, start_time, end_time in shifts_data
+            if name not in existing_shifts
+        ]
+        Shift.objects.bulk_create(new_shifts, ignore_conflicts=True)
+        # bulk_create skips Shift.save(), which normally clears the cached choices
+        cache.delete(ACTIVE_SHIFTS_CACHE_KEY)
+        for shift in new_shifts:
+            self.stdout.write(f'Created shift: {shift.get_name_display()}')
 
         # Create fee configuration
         config = FeeConfiguration.get_instance()
         self.stdout.write('Fee configuration initialized')
 
-        # Create super admin user
-        if not User.objects.filter(username='superadmin').exists():
-            super_admin = User.objects.create_user(
-                username='superadmin',
-                password='admin123',
-                email='admin@apoorva.com',
-                is_staff=True,
-                is_superuser=True
-            )
-            UserProfile.objects.create(
-                user=super_admin,
-                role='SUPER_ADMIN'
-            )
-            self.stdout.write('Created super admin user: superadmin/admin123')
+        # Create super admin, regular admin and demo users from original website
+        users_data = [
+            ('super admin user', 'superadmin', 'admin123', 'admin@apoorva.com', 'SUPER_ADMIN', True),
+            ('admin user', 'admin', 'admin123', 'staff@apoorva.com', 'ADMIN', False),
+            ('demo user', 'Super', 'Super@12345', 'super@apoorva.com', 'SUPER_ADMIN', False),
+        ]
 
-        # Create regular admin user
-        if not User.objects.filter(username='admin').exists():
-            admin_user = User.objects.create_user(
-                username='admin',
-                password='admin123',
-                email='staff@apoorva.com'
-            )
-            UserProfile.objects.create(
-                user=admin_user,
-                role='ADMIN'
+        existing_users = set(User.objects.filter(
+            username__in=[row[1] for row in users_data]
+        ).values_list('username', flat=True))
+        new_users = [row for row in users_data if row[1] not in existing_users]
+
+        # Hashing is deliberately slow, so hash each distinct password once
+        hashed_passwords = {
+            password: make_password(password)
+            for password in {row[2] for row in new_users}
+        }
+        User.objects.bulk_create([
+            User(
+                username=username,
+                password=hashed_passwords[password],
+                email=email,
+                is_staff=is_superuser,
+                is_superuser=is_superuser
             )
-            self.stdout.write('Created admin user: admin/admin123')
+            for label, username, password, email, role, is_superuser in new_users
+        ], ignore_conflicts=True)
 
-        # Create demo users from original website
-        demo_users = [
-            ('Super', 'Super@12345', 'SUPER_ADMIN'),
-        ]
+        # ignore_conflicts leaves primary keys unset, so fetch the new users back
+        roles = {row[1]: row[4] for row in new_users}
+        UserProfile.objects.bulk_create([
+            UserProfile(user=user, role=roles[user.username])
+            for user in User.objects.filter(username__in=roles)
+        ], ignore_conflicts=True)
 
-        for username, password, role in demo_users:
-            if not User.objects.filter(username=username).exists():
-                user = User.objects.create_user(
-                    username=username,
-                    password=password,
-                    email=f'{username.lower()}@apoorva.com'
-                )
-                UserProfile.objects.create(
-                    user=user,
-                    role=role
-                )
-                self.stdout.write(f'Created demo user: {username}/{password}')
+        for label, username, password, email, role, is_superuser in new_users:
+            self.stdout.write(f'Created {label}: {username}/{password}')
 
         self.stdout.write(self.style.SUCCESS('Initial data setup completed!'))
         self.stdout.write(self.style.WARNING('Login credentials:'))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-15 06:13
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def backfill_total_paid(apps, schema_editor):
+    Student = apps.get_model('students', 'Student')
+    students = list(Student.objects.annotate(
+        paid=models.Sum(
+            'fee_transactions__amount_paid',
+            filter=models.Q(fee_transactions__payment_status='COMPLETED')
+        )
+    ))
+    for student in students:
+        student.total_paid = student.paid or Decimal('0.00')
+    Student.objects.bulk_update(students, ['total_paid'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='total_paid',
+            field=models.DecimalField(decimal_places=2, default=0.0, max_digits=10),
+        ),
+        migrations.RunPython(backfill_total_paid, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-15 06:15
+
+from django.db import migrations, models
+
+
+def backfill_last_payment_date(apps, schema_editor):
+    Student = apps.get_model('students', 'Student')
+    students = list(Student.objects.annotate(
+        latest=models.Max(
+            'fee_transactions__payment_date',
+            filter=models.Q(fee_transactions__payment_status='COMPLETED')
+        )
+    ))
+    for student in students:
+        student.last_payment_date = student.latest
+    Student.objects.bulk_update(students, ['last_payment_date'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_attendance_feetransaction_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='last_payment_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_last_payment_date, migrations.RunPython.noop),
+    ]
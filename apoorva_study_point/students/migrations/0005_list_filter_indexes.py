@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-15 06:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0004_student_last_payment_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='students_at_date_e6bf1a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['-date', 'shift', 'student'], name='students_at_date_9f9337_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feetransaction',
+            index=models.Index(fields=['payment_status', '-payment_date'], name='students_fe_payment_522541_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feetransaction',
+            index=models.Index(fields=['student', '-payment_date'], name='students_fe_student_50987d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['is_active', 'fee_status'], name='students_st_is_acti_364619_idx'),
+        ),
+    ]
@@ -1,8 +1,19 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
-from datetime import date, datetime
+from datetime import date
+import secrets
+
+FEE_CONFIG_CACHE_KEY = 'fee_config'
+FEE_CONFIG_CACHE_TIMEOUT = 300
+ACTIVE_SHIFTS_CACHE_KEY = 'active_shift_choices'
+ACTIVE_SHIFTS_CACHE_TIMEOUT = 60
+DASHBOARD_STATS_CACHE_KEY = 'dashboard_stats'
+DASHBOARD_STATS_CACHE_TIMEOUT = 30
+ZERO = Decimal('0.00')
 
 class Shift(models.Model):
     SHIFT_CHOICES = [
@@ -19,6 +30,13 @@ class Shift(models.Model):
     def __str__(self):
         return self.get_name_display()
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Forms render shift choices from the cache
+        cache.delete(ACTIVE_SHIFTS_CACHE_KEY)
+
+SHIFT_LABELS = dict(Shift.SHIFT_CHOICES)
+
 class Student(models.Model):
     FEE_STATUS_CHOICES = [
         ('DUE', 'Due'),
@@ -26,34 +44,56 @@ class Student(models.Model):
         ('OVERDUE', 'Overdue'),
     ]
 
+    # Columns written when fees are recalculated
+    FEE_FIELDS = ['single_shift_fee', 'discount_applied', 'fee_status', 'total_due_amount', 'last_payment_date']
+
     name = models.CharField(max_length=100)
     contact = models.CharField(max_length=15)
     address = models.TextField(blank=True)
     enrolled_shifts = models.ManyToManyField(Shift, related_name='students')
-    single_shift_fee = models.DecimalField(max_digits=10, decimal_places=2, default=1000.00)
-    discount_applied = models.DecimalField(max_digits=5, decimal_places=2, default=0.00)
-    total_due_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    single_shift_fee = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal('1000.00'))
+    discount_applied = models.DecimalField(max_digits=5, decimal_places=2, default=ZERO)
+    total_due_amount = models.DecimalField(max_digits=10, decimal_places=2, default=ZERO)
+    total_paid = models.DecimalField(max_digits=10, decimal_places=2, default=ZERO)
+    last_payment_date = models.DateField(null=True, blank=True)
     fee_status = models.CharField(max_length=10, choices=FEE_STATUS_CHOICES, default='DUE')
     date_enrolled = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_active', 'fee_status']),
+        ]
 
     def __str__(self):
         return self.name
 
     def calculate_total_fee(self):
         """Calculate total fee based on enrolled shifts and discounts"""
-        num_shifts = self.enrolled_shifts.count()
+        # len() reuses prefetched shifts instead of issuing a COUNT query
+        num_shifts = len(self.enrolled_shifts.all())
         if num_shifts == 0:
-            return 0
+            return ZERO
 
         # Get fee configuration
         config = FeeConfiguration.get_instance()
-        base_fee = config.base_single_shift_fee
+        return self.apply_fee_configuration(num_shifts, config)
+
+    def apply_fee_configuration(self, num_shifts, config):
+        """Set fee breakdown for the given shift count and return the final fee"""
+        if num_shifts == 0:
+            return ZERO
 
-        total_fee = base_fee * num_shifts
+        discount, final_fee = Student.compute_fee(num_shifts, config)
+        self.single_shift_fee = config.base_single_shift_fee
+        self.discount_applied = discount
+        return final_fee
+
+    @staticmethod
+    def compute_fee(num_shifts, config):
+        """Return (discount, final fee) for a number of shifts under a fee configuration"""
+        total_fee = config.base_single_shift_fee * num_shifts
 
         # Apply discounts
         if num_shifts == 2:
@@ -61,58 +101,78 @@ class Student(models.Model):
         elif num_shifts >= 3:
             discount = (config.discount_three_plus_shifts / 100) * total_fee
         else:
-            discount = 0
+            discount = ZERO
 
-        self.single_shift_fee = base_fee
-        self.discount_applied = discount
-        final_fee = total_fee - discount
-
-        return final_fee
+        return discount, total_fee - discount
 
     def get_shifts_display(self):
         """Return comma-separated list of enrolled shifts"""
-        return ", ".join([shift.get_name_display() for shift in self.enrolled_shifts.all()])
+        return ", ".join(SHIFT_LABELS.get(shift.name, shift.name) for shift in self.enrolled_shifts.all())
 
     def get_total_paid(self):
-        """Calculate total amount paid by student"""
-        return self.fee_transactions.filter(
-            payment_status='COMPLETED'
-        ).aggregate(
-            total=models.Sum('amount_paid')
-        )['total'] or Decimal('0.00')
+        """Return total amount paid by student (kept up to date by FeeTransaction)"""
+        return self.total_paid
 
     def get_remaining_due(self):
         """Calculate remaining due amount"""
         total_fee = self.calculate_total_fee()
         total_paid = self.get_total_paid()
-        return max(Decimal('0.00'), Decimal(str(total_fee)) - total_paid)
+        return max(ZERO, total_fee - total_paid)
 
-    def update_fee_status(self):
-        """Update fee status based on payments"""
-        remaining_due = self.get_remaining_due()
+    def get_fee_status(self, remaining_due, last_payment_date):
+        """Return the fee status for a remaining due amount and last payment date"""
         if remaining_due <= 0:
-            self.fee_status = 'PAID'
-        elif remaining_due > 0:
-            # Check if payment is overdue (more than 30 days)
-            last_payment = self.fee_transactions.filter(
+            return 'PAID'
+
+        # Check if payment is overdue (more than 30 days)
+        if last_payment_date:
+            days_since_payment = (date.today() - last_payment_date).days
+        else:
+            days_since_payment = (date.today() - self.date_enrolled.date()).days
+        return 'OVERDUE' if days_since_payment > 30 else 'DUE'
+
+    def update_fee_status(self, last_payment_date=None):
+        """Update fee status based on payments
+
+        Callers that already know the latest completed payment date pass it
+        as last_payment_date to skip looking it up.
+        """
+        remaining_due = self.get_remaining_due()
+        if last_payment_date is None:
+            last_payment_date = self.fee_transactions.filter(
                 payment_status='COMPLETED'
-            ).order_by('-payment_date').first()
-
-            if last_payment:
-                days_since_payment = (date.today() - last_payment.payment_date).days
-                if days_since_payment > 30:
-                    self.fee_status = 'OVERDUE'
-                else:
-                    self.fee_status = 'DUE'
-            else:
-                days_since_enrollment = (date.today() - self.date_enrolled.date()).days
-                if days_since_enrollment > 30:
-                    self.fee_status = 'OVERDUE'
-                else:
-                    self.fee_status = 'DUE'
+            ).aggregate(latest=models.Max('payment_date'))['latest']
 
+        self.last_payment_date = last_payment_date
+        self.fee_status = self.get_fee_status(remaining_due, last_payment_date)
         self.total_due_amount = remaining_due
-        self.save()
+        self.save(update_fields=self.FEE_FIELDS)
+
+    @classmethod
+    def bulk_refresh_fee_status(cls, student_ids):
+        """Recalculate fees and fee status for many students in two queries"""
+        completed = FeeTransaction.objects.filter(
+            student=OuterRef('pk'),
+            payment_status='COMPLETED'
+        ).order_by()
+        students = list(cls.objects.filter(id__in=student_ids).annotate(
+            shift_count=models.Count('enrolled_shifts'),
+            latest_payment_date=Subquery(
+                completed.order_by('-payment_date').values('payment_date')[:1]
+            ),
+        ))
+
+        config = FeeConfiguration.get_instance()
+        for student in students:
+            total_fee = student.apply_fee_configuration(student.shift_count, config)
+            remaining_due = max(ZERO, total_fee - student.total_paid)
+            student.last_payment_date = student.latest_payment_date
+            student.fee_status = student.get_fee_status(remaining_due, student.last_payment_date)
+            student.total_due_amount = remaining_due
+
+        cls.objects.bulk_update(students, cls.FEE_FIELDS, batch_size=500)
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
+        return students
 
 class Attendance(models.Model):
     STATUS_CHOICES = [
@@ -132,10 +192,32 @@ class Attendance(models.Model):
     class Meta:
         unique_together = ['student', 'shift', 'date']
         ordering = ['-date', 'shift', 'student']
+        indexes = [
+            models.Index(fields=['-date', 'shift', 'student']),
+            models.Index(fields=['student', 'date']),
+        ]
 
     def __str__(self):
         return f"{self.student.name} - {self.shift} - {self.date} - {self.status}"
 
+    @classmethod
+    def bulk_mark(cls, attendance_date, shift, marked_by, status_map):
+        """Create or update attendance for many students ({student_id: status}) in batches"""
+        records = [
+            cls(student_id=student_id, shift=shift, date=attendance_date,
+                status=status, marked_by=marked_by)
+            for student_id, status in status_map.items()
+        ]
+        # Re-marking a day overwrites the earlier status instead of skipping it
+        with transaction.atomic():
+            return cls.objects.bulk_create(
+                records,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['student', 'shift', 'date'],
+                update_fields=['status', 'marked_by']
+            )
+
 class FeeTransaction(models.Model):
     PAYMENT_STATUS_CHOICES = [
         ('PENDING', 'Pending'),
@@ -148,7 +230,7 @@ class FeeTransaction(models.Model):
     amount_paid = models.DecimalField(max_digits=10, decimal_places=2)
     payment_date = models.DateField()
     payment_status = models.CharField(max_length=10, choices=PAYMENT_STATUS_CHOICES, default='COMPLETED')
-    remaining_due_after_payment = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    remaining_due_after_payment = models.DecimalField(max_digits=10, decimal_places=2, default=ZERO)
     processed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     transaction_id = models.CharField(max_length=100, unique=True, blank=True)
     notes = models.TextField(blank=True)
@@ -156,39 +238,97 @@ class FeeTransaction(models.Model):
 
     class Meta:
         ordering = ['-payment_date', '-created_at']
+        indexes = [
+            models.Index(fields=['-payment_date', 'payment_status']),
+            models.Index(fields=['payment_status', '-payment_date']),
+            models.Index(fields=['student', 'payment_status']),
+            models.Index(fields=['student', '-payment_date']),
+        ]
 
     def __str__(self):
         return f"{self.student.name} - ₹{self.amount_paid} - {self.payment_date}"
 
-    def save(self, *args, **kwargs):
+    @property
+    def completed_amount(self):
+        """Amount this transaction adds to the student's total paid"""
+        return self.amount_paid if self.payment_status == 'COMPLETED' else ZERO
+
+    def save(self, *args, skip_refresh=False, **kwargs):
+        # Callers recording many payments pass skip_refresh=True and then
+        # refresh once with Student.bulk_refresh_fee_status()
         # Generate transaction ID if not provided
         if not self.transaction_id:
-            self.transaction_id = f"TXN{self.student.id}{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            # Random suffix so payments recorded in the same second don't collide
+            self.transaction_id = f"TXN{self.student_id}{secrets.token_hex(8).upper()}"
+
+        is_new = self._state.adding
+
+        # What the stored row contributed before this save, and to which
+        # student, for edits, refunds and payments moved between students
+        previous_amount = ZERO
+        previous_student_id = None
+        if self.pk:
+            previous = FeeTransaction.objects.filter(pk=self.pk).only(
+                'student_id', 'amount_paid', 'payment_status'
+            ).first()
+            if previous:
+                previous_amount = previous.completed_amount
+                previous_student_id = previous.student_id
 
         super().save(*args, **kwargs)
 
+        if previous_student_id is not None and previous_student_id != self.student_id:
+            # Moved to another student: the old student loses the whole old
+            # amount and the new student gains the whole new amount
+            if previous_amount:
+                Student.objects.filter(pk=previous_student_id).update(
+                    total_paid=F('total_paid') - previous_amount
+                )
+            if not skip_refresh:
+                Student.objects.get(pk=previous_student_id).update_fee_status()
+            paid_change = self.completed_amount
+        else:
+            paid_change = self.completed_amount - previous_amount
+
+        if paid_change:
+            Student.objects.filter(pk=self.student_id).update(
+                total_paid=F('total_paid') + paid_change
+            )
+            self.student.refresh_from_db(fields=['total_paid'])
+
         # Update student's fee status after saving transaction
-        if self.payment_status == 'COMPLETED':
-            self.student.update_fee_status()
+        if (self.payment_status == 'COMPLETED' or paid_change) and not skip_refresh:
+            # A new completed payment dated on/after the stored one is the latest payment
+            last_payment_date = None
+            stored_date = self.student.last_payment_date
+            if is_new and self.payment_status == 'COMPLETED' and (
+                stored_date is None or self.payment_date >= stored_date
+            ):
+                last_payment_date = self.payment_date
+            self.student.update_fee_status(last_payment_date=last_payment_date)
+
+        # Cleared only once the student totals above are written, so a poll
+        # in between cannot cache the old pending amount
+        cache.delete(DASHBOARD_STATS_CACHE_KEY)
 
 class FeeConfiguration(models.Model):
     base_single_shift_fee = models.DecimalField(
         max_digits=10, 
         decimal_places=2, 
-        default=1000.00,
+        default=Decimal('1000.00'),
         validators=[MinValueValidator(0)]
     )
     discount_two_shifts = models.DecimalField(
         max_digits=5, 
         decimal_places=2, 
-        default=10.00,
+        default=Decimal('10.00'),
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         help_text="Discount percentage for 2 enrolled shifts"
     )
     discount_three_plus_shifts = models.DecimalField(
         max_digits=5, 
         decimal_places=2, 
-        default=20.00,
+        default=Decimal('20.00'),
         validators=[MinValueValidator(0), MaxValueValidator(100)],
         help_text="Discount percentage for 3 or more enrolled shifts"
     )
@@ -202,11 +342,22 @@ class FeeConfiguration(models.Model):
     def __str__(self):
         return f"Fee Config - Base: ₹{self.base_single_shift_fee}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Drop the cached copy so the next read sees the new values
+        cache.delete(FEE_CONFIG_CACHE_KEY)
+
     @classmethod
     def get_instance(cls):
-        """Get or create the single fee configuration instance"""
-        config, created = cls.objects.get_or_create(pk=1)
-        return config
+        """Get or create the single fee configuration instance (cached)"""
+        def load():
+            # The row almost always exists, so try a plain SELECT before creating it
+            try:
+                return cls.objects.get(pk=1)
+            except cls.DoesNotExist:
+                return cls.objects.create(pk=1)
+
+        return cache.get_or_set(FEE_CONFIG_CACHE_KEY, load, FEE_CONFIG_CACHE_TIMEOUT)
 
 class UserProfile(models.Model):
     ROLE_CHOICES = [
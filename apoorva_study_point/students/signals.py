@@ -0,0 +1,31 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import (
+    Student, Shift, FeeTransaction, ACTIVE_SHIFTS_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY
+)
+
+
+@receiver(post_delete, sender=FeeTransaction)
+def remove_deleted_payment(sender, instance, **kwargs):
+    """Take a deleted payment out of its student's stored totals
+
+    A receiver rather than FeeTransaction.delete() so queryset deletes from
+    the admin and cascades from Student are counted too.
+    """
+    if instance.completed_amount:
+        Student.objects.filter(pk=instance.student_id).update(
+            total_paid=F('total_paid') - instance.completed_amount
+        )
+        instance.student.refresh_from_db(fields=['total_paid'])
+        instance.student.update_fee_status()
+
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
+
+
+@receiver(post_delete, sender=Shift)
+def clear_deleted_shift_choices(sender, instance, **kwargs):
+    """Drop the cached shift choices so forms stop offering a deleted shift"""
+    cache.delete(ACTIVE_SHIFTS_CACHE_KEY)
@@ -1,3 +1,133 @@
-from django.test import TestCase
+from datetime import date, time
+from decimal import Decimal
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db.models import Sum
+from django.test import TestCase, RequestFactory
+
+from .forms import get_active_shift_choices
+from .models import Student, Shift, FeeTransaction
+from .views import FeeReportView
+
+
+class StudentTotalPaidTests(TestCase):
+    """Student.total_paid must always equal the sum of completed payments"""
+
+    def setUp(self):
+        shift = Shift.objects.create(name='MORNING', start_time=time(9, 0), end_time=time(12, 0))
+        self.alice = Student.objects.create(name='Alice', contact='1')
+        self.bob = Student.objects.create(name='Bob', contact='2')
+        for student in (self.alice, self.bob):
+            student.enrolled_shifts.set([shift])
+            student.calculate_total_fee()
+            student.update_fee_status()
+
+    def assertTotalsMatchPayments(self):
+        for student in (self.alice, self.bob):
+            student.refresh_from_db()
+            paid = FeeTransaction.objects.filter(
+                student=student, payment_status='COMPLETED'
+            ).aggregate(total=Sum('amount_paid'))['total'] or Decimal('0.00')
+            self.assertEqual(student.total_paid, paid, student.name)
+            self.assertEqual(student.total_due_amount, student.get_remaining_due(), student.name)
+
+    def test_total_paid_follows_payment_changes(self):
+        payment = FeeTransaction.objects.create(
+            student=self.alice, amount_paid=Decimal('500.00'), payment_date=date.today()
+        )
+        self.assertTotalsMatchPayments()
+
+        payment.amount_paid = Decimal('300.00')
+        payment.save()
+        self.assertTotalsMatchPayments()
+
+        payment.student = self.bob
+        payment.save()
+        self.assertTotalsMatchPayments()
+        self.assertIsNone(self.alice.last_payment_date)
+
+        payment.payment_status = 'REFUNDED'
+        payment.save()
+        self.assertTotalsMatchPayments()
+
+        payment.payment_status = 'COMPLETED'
+        payment.student = self.alice
+        payment.save()
+        self.assertTotalsMatchPayments()
+
+        payment.delete()
+        self.assertTotalsMatchPayments()
+        self.assertEqual(self.alice.total_paid, Decimal('0.00'))
+
+    def test_skip_refresh_defers_fee_status_on_move(self):
+        payment = FeeTransaction.objects.create(
+            student=self.alice, amount_paid=Decimal('500.00'), payment_date=date.today()
+        )
+        self.alice.refresh_from_db()
+        due_before_move = self.alice.total_due_amount
+
+        payment.student = self.bob
+        payment.save(skip_refresh=True)
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.total_paid, Decimal('0.00'))
+        self.assertEqual(self.alice.total_due_amount, due_before_move)
+
+        Student.bulk_refresh_fee_status([self.alice.pk, self.bob.pk])
+        self.assertTotalsMatchPayments()
+
+    def test_queryset_delete_updates_total_paid(self):
+        for student in (self.alice, self.bob):
+            FeeTransaction.objects.create(
+                student=student, amount_paid=Decimal('200.00'), payment_date=date.today()
+            )
+        FeeTransaction.objects.filter(student=self.alice).delete()
+        self.assertTotalsMatchPayments()
+
+
+class ActiveShiftChoicesCacheTests(TestCase):
+    """Cached shift choices must not outlive shifts that are removed"""
+
+    def test_deleting_shift_clears_cached_choices(self):
+        shift = Shift.objects.create(name='NOON', start_time=time(13, 0), end_time=time(16, 0))
+        shift_id = shift.pk
+        self.assertIn(shift_id, dict(get_active_shift_choices()))
+        shift.delete()
+        self.assertNotIn(shift_id, dict(get_active_shift_choices()))
+
+
+class FeeMonthFilterTests(TestCase):
+    """Month filters must reject impossible months instead of erroring"""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser('owner', 'owner@example.com', 'pass')
+        student = Student.objects.create(name='Alice', contact='1')
+        FeeTransaction.objects.create(
+            student=student, amount_paid=Decimal('100.00'), payment_date=date(2026, 1, 15)
+        )
+
+    def test_fee_list_month_filter(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/fees/', {'month_filter': '2026-01'})
+        self.assertEqual(len(response.context['transactions']), 1)
+        response = self.client.get('/fees/', {'month_filter': '2026-02'})
+        self.assertEqual(len(response.context['transactions']), 0)
+
+        for month in ('2026-13', '2026-00', 'soon'):
+            response = self.client.get('/fees/', {'month_filter': month})
+            self.assertEqual(response.status_code, 200, month)
+            self.assertTrue(response.context['filter_form'].errors, month)
+
+    def test_fee_report_out_of_range_month(self):
+        for month in ('2026-13', '2026-00', 'soon'):
+            request = RequestFactory().get('/reports/fees/', {'month': month})
+            request.user = self.user
+            view = FeeReportView()
+            view.setup(request)
+            context = view.get_context_data()
+            self.assertEqual(context['month_filter'], month)
+
+        request = RequestFactory().get('/reports/fees/', {'month': '2026-01'})
+        request.user = self.user
+        view = FeeReportView()
+        view.setup(request)
+        self.assertEqual(len(view.get_context_data()['transactions']), 1)
@@ -1,54 +1,67 @@
-from django.urls import path
+from django.urls import path, include
 from django.contrib.auth import views as auth_views
+from django.views.generic import RedirectView
 from . import views
 
 urlpatterns = [
+    # Dashboard and the AJAX API it polls, listed first so they resolve first
+    path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
+    path('api/', include('students.api_urls')),
+
     # Authentication URLs
-    path('', views.CustomLoginView.as_view(), name='login'),
+    path('', RedirectView.as_view(pattern_name='login', permanent=True)),
     path('login/', views.CustomLoginView.as_view(), name='login'),
     path('logout/', auth_views.LogoutView.as_view(), name='logout'),
 
-    # Dashboard
-    path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
-
     # Student Management
-    path('students/', views.StudentListView.as_view(), name='student_list'),
-    path('students/add/', views.StudentCreateView.as_view(), name='student_add'),
-    path('students/<int:pk>/edit/', views.StudentUpdateView.as_view(), name='student_edit'),
-    path('students/<int:pk>/delete/', views.StudentDeleteView.as_view(), name='student_delete'),
-    path('students/<int:pk>/detail/', views.StudentDetailView.as_view(), name='student_detail'),
+    path('students/', include([
+        path('', views.StudentListView.as_view(), name='student_list'),
+        path('add/', views.StudentCreateView.as_view(), name='student_add'),
+        path('<int:pk>/<str:action>/', views.CRUDDispatchView.as_view(actions={
+            'edit': views.StudentUpdateView.as_view(),
+            'delete': views.StudentDeleteView.as_view(),
+            'detail': views.StudentDetailView.as_view(),
+        }), name='student_crud'),
+    ])),
 
     # Attendance Management
-    path('attendance/', views.AttendanceListView.as_view(), name='attendance_list'),
-    path('attendance/mark/', views.MarkAttendanceView.as_view(), name='mark_attendance'),
-    path('attendance/bulk/', views.BulkAttendanceView.as_view(), name='bulk_attendance'),
-    path('attendance/<int:pk>/edit/', views.AttendanceUpdateView.as_view(), name='attendance_edit'),
+    path('attendance/', include([
+        path('', views.AttendanceListView.as_view(), name='attendance_list'),
+        path('mark/', views.MarkAttendanceView.as_view(), name='mark_attendance'),
+        path('bulk/', views.BulkAttendanceView.as_view(), name='bulk_attendance'),
+        path('<int:pk>/edit/', views.AttendanceUpdateView.as_view(), name='attendance_edit'),
+    ])),
 
     # Fee Management
-    path('fees/', views.FeeTransactionListView.as_view(), name='fee_list'),
-    path('fees/add/', views.FeeTransactionCreateView.as_view(), name='fee_add'),
-    path('fees/<int:pk>/edit/', views.FeeTransactionUpdateView.as_view(), name='fee_edit'),
-    path('fees/<int:pk>/delete/', views.FeeTransactionDeleteView.as_view(), name='fee_delete'),
+    path('fees/', include([
+        path('', views.FeeTransactionListView.as_view(), name='fee_list'),
+        path('add/', views.FeeTransactionCreateView.as_view(), name='fee_add'),
+        path('<int:pk>/<str:action>/', views.CRUDDispatchView.as_view(actions={
+            'edit': views.FeeTransactionUpdateView.as_view(),
+            'delete': views.FeeTransactionDeleteView.as_view(),
+        }), name='fee_crud'),
+    ])),
 
     # Analytics & Reports
     path('analytics/', views.AnalyticsView.as_view(), name='analytics'),
-    path('reports/attendance/', views.AttendanceReportView.as_view(), name='attendance_report'),
-    path('reports/fees/', views.FeeReportView.as_view(), name='fee_report'),
-    path('export/attendance/', views.ExportAttendanceView.as_view(), name='export_attendance'),
-    path('export/fees/', views.ExportFeesView.as_view(), name='export_fees'),
+    path('reports/', include([
+        path('attendance/', views.AttendanceReportView.as_view(), name='attendance_report'),
+        path('fees/', views.FeeReportView.as_view(), name='fee_report'),
+    ])),
+    path('export/', include('students.export_urls')),
 
     # Admin User Management
-    path('admin-users/', views.AdminUserListView.as_view(), name='admin_user_list'),
-    path('admin-users/add/', views.AdminUserCreateView.as_view(), name='admin_user_add'),
-    path('admin-users/<int:pk>/edit/', views.AdminUserUpdateView.as_view(), name='admin_user_edit'),
-    path('admin-users/<int:pk>/delete/', views.AdminUserDeleteView.as_view(), name='admin_user_delete'),
+    path('admin-users/', include([
+        path('', views.AdminUserListView.as_view(), name='admin_user_list'),
+        path('add/', views.AdminUserCreateView.as_view(), name='admin_user_add'),
+        path('<int:pk>/<str:action>/', views.CRUDDispatchView.as_view(actions={
+            'edit': views.AdminUserUpdateView.as_view(),
+            'delete': views.AdminUserDeleteView.as_view(),
+        }), name='admin_user_crud'),
+    ])),
 
     # Fee Configuration
-    path('config/fees/', views.FeeConfigurationView.as_view(), name='fee_config'),
-
-    # API endpoints for AJAX calls
-    path('api/students/search/', views.StudentSearchAPIView.as_view(), name='api_student_search'),
-    path('api/attendance/chart/', views.AttendanceChartAPIView.as_view(), name='api_attendance_chart'),
-    path('api/fee/chart/', views.FeeChartAPIView.as_view(), name='api_fee_chart'),
-    path('api/dashboard/stats/', views.DashboardStatsAPIView.as_view(), name='api_dashboard_stats'),
+    path('config/', include([
+        path('fees/', views.FeeConfigurationView.as_view(), name='fee_config'),
+    ])),
 ]
@@ -1,51 +1,104 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.views import LoginView
+from django.contrib.auth.views import LoginView, redirect_to_login
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.core.exceptions import PermissionDenied
 from django.contrib import messages
 from django.views.generic import (
     ListView, CreateView, UpdateView, DeleteView,
     DetailView, FormView, TemplateView
 )
 from django.views import View
-from django.http import JsonResponse, HttpResponse
-from django.db.models import Q, Sum, Count, Avg
+from django.http import HttpResponse, StreamingHttpResponse, FileResponse, Http404
+from django.db.models import Q, Sum, Count, Avg, Value, Prefetch, CharField
+from django.db.models.functions import Cast, Coalesce, TruncMonth
 from django.urls import reverse_lazy, reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from asgiref.sync import sync_to_async
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+from io import BytesIO
 import json
 import csv
+import orjson
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer
 
-from .models import Student, Attendance, FeeTransaction, FeeConfiguration, UserProfile, Shift
+from .models import (
+    Student, Attendance, FeeTransaction, FeeConfiguration, UserProfile, Shift,
+    DASHBOARD_STATS_CACHE_KEY, DASHBOARD_STATS_CACHE_TIMEOUT
+)
 from .forms import (
     StudentForm, AttendanceForm, BulkAttendanceForm, FeeTransactionForm,
     FeeConfigurationForm, CustomUserCreationForm, StudentSearchForm,
     AttendanceFilterForm, FeeTransactionFilterForm
 )
 
+def month_bounds(year, month):
+    """Return the first day of the month and of the month after it
+
+    Filtering on date__gte/date__lt with these lets the database use an
+    index on the date column, unlike __year/__month lookups.
+    """
+    first_day = date(year, month, 1)
+    if month == 12:
+        return first_day, date(year + 1, 1, 1)
+    return first_day, date(year, month + 1, 1)
+
+def get_user_profile(user):
+    """Return the user's profile, or None if they have none
+
+    Django caches the related profile on the user object, so repeated checks
+    in one request query it only once.
+    """
+    if not user.is_authenticated:
+        return None
+    try:
+        return user.profile
+    except UserProfile.DoesNotExist:
+        return None
+
 class AdminRequiredMixin(UserPassesTestMixin):
     """Mixin to ensure user is admin or super admin"""
     def test_func(self):
-        try:
-            return self.request.user.profile.is_admin
-        except:
-            return self.request.user.is_superuser
+        profile = get_user_profile(self.request.user)
+        return profile.is_admin if profile else self.request.user.is_superuser
 
 class SuperAdminRequiredMixin(UserPassesTestMixin):
     """Mixin to ensure user is super admin"""
     def test_func(self):
-        try:
-            return self.request.user.profile.is_super_admin
-        except:
-            return self.request.user.is_superuser
+        profile = get_user_profile(self.request.user)
+        return profile.is_super_admin if profile else self.request.user.is_superuser
+
+class AsyncAdminRequiredMixin:
+    """Login and admin checks for async views, using the async auth API"""
+    async def dispatch(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+
+        profile = await UserProfile.objects.filter(user=user).afirst()
+        is_admin = profile.is_admin if profile else user.is_superuser
+        if not is_admin:
+            raise PermissionDenied
+        return await super().dispatch(request, *args, **kwargs)
+
+class CRUDDispatchView(View):
+    """Route <pk>/<action>/ URLs to the view registered for that action"""
+    actions = {}
+
+    def dispatch(self, request, *args, **kwargs):
+        view = self.actions.get(kwargs.pop('action'))
+        if view is None:
+            raise Http404
+        return view(request, *args, **kwargs)
 
 class CustomLoginView(LoginView):
     template_name = 'login.html'
@@ -64,23 +117,21 @@ class DashboardView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Calculate dashboard statistics
-        total_students = Student.objects.filter(is_active=True).count()
+        # Active student count and pending fees in one pass
+        student_stats = Student.objects.filter(is_active=True).aggregate(
+            total_students=Count('id'),
+            total_pending=Coalesce(Sum('total_due_amount'), Value(Decimal('0.00'))),
+        )
 
         # Total revenue collected
-        total_revenue = FeeTransaction.objects.filter(
+        revenue = FeeTransaction.objects.filter(
             payment_status='COMPLETED'
-        ).aggregate(total=Sum('amount_paid'))['total'] or Decimal('0.00')
-
-        # Total pending fees
-        total_pending = Student.objects.filter(
-            is_active=True
-        ).aggregate(total=Sum('total_due_amount'))['total'] or Decimal('0.00')
+        ).aggregate(total=Coalesce(Sum('amount_paid'), Value(Decimal('0.00'))))
 
         context.update({
-            'total_students': total_students,
-            'total_revenue': total_revenue,
-            'total_pending': total_pending,
+            'total_students': student_stats['total_students'],
+            'total_revenue': revenue['total'],
+            'total_pending': student_stats['total_pending'],
         })
 
         return context
@@ -91,11 +142,20 @@ class StudentListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
     context_object_name = 'students'
     paginate_by = 20
 
+    @cached_property
+    def search_form(self):
+        # Built once per request and shared by get_queryset() and the template
+        return StudentSearchForm(self.request.GET)
+
     def get_queryset(self):
-        queryset = Student.objects.filter(is_active=True).prefetch_related('enrolled_shifts')
+        queryset = Student.objects.filter(is_active=True).only(
+            'id', 'name', 'contact', 'fee_status', 'total_due_amount'
+        ).prefetch_related(
+            Prefetch('enrolled_shifts', queryset=Shift.objects.only('id', 'name'))
+        )
 
         # Apply search and filters
-        search_form = StudentSearchForm(self.request.GET)
+        search_form = self.search_form
         if search_form.is_valid():
             search_query = search_form.cleaned_data.get('search_query')
             shift_filter = search_form.cleaned_data.get('shift_filter')
@@ -117,7 +177,7 @@ class StudentListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['search_form'] = StudentSearchForm(self.request.GET)
+        context['search_form'] = self.search_form
         return context
 
 class StudentCreateView(LoginRequiredMixin, AdminRequiredMixin, CreateView):
@@ -153,12 +213,11 @@ class StudentDeleteView(LoginRequiredMixin, AdminRequiredMixin, DeleteView):
     template_name = 'students/student_confirm_delete.html'
     success_url = reverse_lazy('student_list')
 
-    def delete(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        # Soft delete
-        self.object.is_active = False
-        self.object.save()
-        messages.success(request, f'Student {self.object.name} deleted successfully!')
+    def post(self, request, *args, **kwargs):
+        # Soft delete; DeleteView's own post() would remove the row
+        student = get_object_or_404(Student.objects.only('id', 'name'), pk=kwargs['pk'])
+        Student.objects.filter(pk=student.pk).update(is_active=False)
+        messages.success(request, f'Student {student.name} deleted successfully!')
         return redirect(self.success_url)
 
 class StudentDetailView(LoginRequiredMixin, AdminRequiredMixin, DetailView):
@@ -171,22 +230,31 @@ class StudentDetailView(LoginRequiredMixin, AdminRequiredMixin, DetailView):
         student = self.object
 
         # Get recent attendance records
-        recent_attendance = student.attendance_records.order_by('-date')[:10]
+        recent_attendance = student.attendance_records.select_related(
+            'shift', 'marked_by'
+        ).order_by('-date')[:10]
 
         # Get recent fee transactions
-        recent_transactions = student.fee_transactions.order_by('-payment_date')[:10]
+        recent_transactions = student.fee_transactions.select_related(
+            'processed_by'
+        ).order_by('-payment_date')[:10]
 
         # Calculate attendance statistics
-        total_attendance = student.attendance_records.count()
-        present_count = student.attendance_records.filter(status='PRESENT').count()
+        attendance_stats = student.attendance_records.aggregate(
+            total=Count('id'),
+            present=Count('id', filter=Q(status='PRESENT'))
+        )
+        total_attendance = attendance_stats['total']
+        present_count = attendance_stats['present']
         attendance_percentage = (present_count / total_attendance * 100) if total_attendance > 0 else 0
 
+        # Paid and due totals are stored on the student
         context.update({
             'recent_attendance': recent_attendance,
             'recent_transactions': recent_transactions,
             'attendance_percentage': round(attendance_percentage, 2),
-            'total_paid': student.get_total_paid(),
-            'remaining_due': student.get_remaining_due(),
+            'total_paid': student.total_paid,
+            'remaining_due': student.total_due_amount,
         })
 
         return context
@@ -197,11 +265,15 @@ class AttendanceListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
     context_object_name = 'attendance_records'
     paginate_by = 50
 
+    @cached_property
+    def filter_form(self):
+        return AttendanceFilterForm(self.request.GET)
+
     def get_queryset(self):
         queryset = Attendance.objects.select_related('student', 'shift', 'marked_by')
 
         # Apply filters
-        filter_form = AttendanceFilterForm(self.request.GET)
+        filter_form = self.filter_form
         if filter_form.is_valid():
             date_from = filter_form.cleaned_data.get('date_from')
             date_to = filter_form.cleaned_data.get('date_to')
@@ -221,7 +293,7 @@ class AttendanceListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['filter_form'] = AttendanceFilterForm(self.request.GET)
+        context['filter_form'] = self.filter_form
         context['shifts'] = Shift.objects.filter(is_active=True)
         return context
 
@@ -251,11 +323,11 @@ class BulkAttendanceView(LoginRequiredMixin, AdminRequiredMixin, FormView):
         if shift_id:
             try:
                 shift = Shift.objects.get(id=shift_id)
-                # Get students enrolled in this shift
-                students = Student.objects.filter(
+                # Get students enrolled in this shift, evaluated once for the form
+                students = list(Student.objects.filter(
                     enrolled_shifts=shift,
                     is_active=True
-                ).order_by('name')
+                ).only('id', 'name').order_by('name'))
                 kwargs['students'] = students
             except Shift.DoesNotExist:
                 kwargs['students'] = []
@@ -276,28 +348,21 @@ class BulkAttendanceView(LoginRequiredMixin, AdminRequiredMixin, FormView):
         shift = form.cleaned_data['shift']
 
         # Process bulk attendance
-        created_count = 0
-        for field_name, status in form.cleaned_data.items():
-            if field_name.startswith('student_'):
-                student_id = field_name.split('_')[1]
-                try:
-                    student = Student.objects.get(id=student_id)
-                    attendance, created = Attendance.objects.get_or_create(
-                        student=student,
-                        shift=shift,
-                        date=attendance_date,
-                        defaults={
-                            'status': status,
-                            'marked_by': self.request.user
-                        }
-                    )
-                    if not created:
-                        attendance.status = status
-                        attendance.marked_by = self.request.user
-                        attendance.save()
-                    created_count += 1
-                except Student.DoesNotExist:
-                    continue
+        status_map = {
+            int(field_name.split('_')[1]): status
+            for field_name, status in form.cleaned_data.items()
+            if field_name.startswith('student_')
+        }
+        valid_ids = set(Student.objects.filter(
+            id__in=status_map, is_active=True
+        ).values_list('id', flat=True))
+
+        records = Attendance.bulk_mark(attendance_date, shift, self.request.user, {
+            student_id: status
+            for student_id, status in status_map.items()
+            if student_id in valid_ids
+        })
+        created_count = len(records)
 
         messages.success(self.request, f'Attendance marked for {created_count} students!')
         return redirect('attendance_list')
@@ -319,11 +384,15 @@ class FeeTransactionListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
     context_object_name = 'transactions'
     paginate_by = 50
 
+    @cached_property
+    def filter_form(self):
+        return FeeTransactionFilterForm(self.request.GET)
+
     def get_queryset(self):
         queryset = FeeTransaction.objects.select_related('student', 'processed_by')
 
         # Apply filters
-        filter_form = FeeTransactionFilterForm(self.request.GET)
+        filter_form = self.filter_form
         if filter_form.is_valid():
             status_filter = filter_form.cleaned_data.get('status_filter')
             month_filter = filter_form.cleaned_data.get('month_filter')
@@ -332,10 +401,10 @@ class FeeTransactionListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
             if status_filter:
                 queryset = queryset.filter(payment_status=status_filter)
             if month_filter:
-                year, month = month_filter.split('-')
+                first_day, next_first_day = month_bounds(month_filter.year, month_filter.month)
                 queryset = queryset.filter(
-                    payment_date__year=year,
-                    payment_date__month=month
+                    payment_date__gte=first_day,
+                    payment_date__lt=next_first_day
                 )
             if shift_filter:
                 queryset = queryset.filter(student__enrolled_shifts=shift_filter)
@@ -344,7 +413,7 @@ class FeeTransactionListView(LoginRequiredMixin, AdminRequiredMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['filter_form'] = FeeTransactionFilterForm(self.request.GET)
+        context['filter_form'] = self.filter_form
         return context
 
 class FeeTransactionCreateView(LoginRequiredMixin, AdminRequiredMixin, CreateView):
@@ -354,20 +423,20 @@ class FeeTransactionCreateView(LoginRequiredMixin, AdminRequiredMixin, CreateVie
     success_url = reverse_lazy('fee_list')
 
     def form_valid(self, form):
-        transaction = form.save(commit=False)
+        transaction = form.instance
         transaction.processed_by = self.request.user
 
         # Calculate remaining due after this payment
         student = transaction.student
-        current_due = student.get_remaining_due()
         transaction.remaining_due_after_payment = max(
             Decimal('0.00'), 
-            current_due - transaction.amount_paid
+            student.total_due_amount - transaction.amount_paid
         )
 
-        transaction.save()
+        # The form saves the transaction once, which updates the student's totals
+        response = super().form_valid(form)
         messages.success(self.request, f'Fee payment of ₹{transaction.amount_paid} recorded successfully!')
-        return super().form_valid(form)
+        return response
 
 class FeeTransactionUpdateView(LoginRequiredMixin, AdminRequiredMixin, UpdateView):
     model = FeeTransaction
@@ -385,14 +454,10 @@ class FeeTransactionDeleteView(LoginRequiredMixin, AdminRequiredMixin, DeleteVie
     template_name = 'fees/fee_transaction_confirm_delete.html'
     success_url = reverse_lazy('fee_list')
 
-    def delete(self, request, *args, **kwargs):
-        transaction = self.get_object()
-        student = transaction.student
-        response = super().delete(request, *args, **kwargs)
-
-        # Update student's fee status after deletion
-        student.update_fee_status()
-        messages.success(request, 'Fee transaction deleted successfully!')
+    def form_valid(self, form):
+        # Deleting the transaction updates the student's totals (see signals.py)
+        response = super().form_valid(form)
+        messages.success(self.request, 'Fee transaction deleted successfully!')
         return response
 
 class AnalyticsView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
@@ -401,11 +466,19 @@ class AnalyticsView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Student attendance summary
+        # total_paid and total_due_amount are kept on the row, so only the
+        # attendance counts need a join
+        students = Student.objects.filter(is_active=True).annotate(
+            total_recorded=Count('attendance_records'),
+            total_present=Count('attendance_records', filter=Q(attendance_records__status='PRESENT')),
+        )
+
         attendance_summary = []
-        for student in Student.objects.filter(is_active=True):
-            total_recorded = student.attendance_records.count()
-            total_present = student.attendance_records.filter(status='PRESENT').count()
+        fee_summary = []
+        for student in students:
+            # Student attendance summary
+            total_recorded = student.total_recorded
+            total_present = student.total_present
             attendance_percentage = (total_present / total_recorded * 100) if total_recorded > 0 else 0
 
             attendance_summary.append({
@@ -415,16 +488,11 @@ class AnalyticsView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
                 'attendance_percentage': round(attendance_percentage, 2)
             })
 
-        # Student fee summary
-        fee_summary = []
-        for student in Student.objects.filter(is_active=True):
-            total_paid = student.get_total_paid()
-            current_due = student.get_remaining_due()
-
+            # Student fee summary
             fee_summary.append({
                 'student': student,
-                'total_paid': total_paid,
-                'current_due': current_due,
+                'total_paid': student.total_paid,
+                'current_due': student.total_due_amount,
                 'status': student.fee_status
             })
 
@@ -435,6 +503,8 @@ class AnalyticsView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
 
         return context
 
+REPORT_PAGE_SIZE = 100
+
 class AttendanceReportView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
     template_name = 'analytics/attendance_report.html'
 
@@ -457,7 +527,12 @@ class AttendanceReportView(LoginRequiredMixin, AdminRequiredMixin, TemplateView)
                 date__gte=first_day
             ).select_related('student', 'shift')
 
-        context['attendance_data'] = attendance_data
+        # Show the report a page at a time instead of loading every record
+        page_obj = Paginator(attendance_data, REPORT_PAGE_SIZE).get_page(self.request.GET.get('page'))
+
+        context['attendance_data'] = page_obj
+        context['page_obj'] = page_obj
+        context['is_paginated'] = page_obj.has_other_pages()
         context['date_from'] = date_from
         context['date_to'] = date_to
 
@@ -472,21 +547,25 @@ class FeeReportView(LoginRequiredMixin, AdminRequiredMixin, TemplateView):
         # Generate detailed fee report
         month_filter = self.request.GET.get('month')
 
+        # Default to current month, also when the month is malformed or out of range
+        report_month = date.today()
         if month_filter:
-            year, month = month_filter.split('-')
-            transactions = FeeTransaction.objects.filter(
-                payment_date__year=year,
-                payment_date__month=month
-            ).select_related('student', 'processed_by')
-        else:
-            # Default to current month
-            today = date.today()
-            transactions = FeeTransaction.objects.filter(
-                payment_date__year=today.year,
-                payment_date__month=today.month
-            ).select_related('student', 'processed_by')
+            try:
+                report_month = datetime.strptime(month_filter, '%Y-%m').date()
+            except ValueError:
+                pass
+        first_day, next_first_day = month_bounds(report_month.year, report_month.month)
+
+        transactions = FeeTransaction.objects.filter(
+            payment_date__gte=first_day,
+            payment_date__lt=next_first_day
+        ).select_related('student', 'processed_by')
+
+        page_obj = Paginator(transactions, REPORT_PAGE_SIZE).get_page(self.request.GET.get('page'))
 
-        context['transactions'] = transactions
+        context['transactions'] = page_obj
+        context['page_obj'] = page_obj
+        context['is_paginated'] = page_obj.has_other_pages()
         context['month_filter'] = month_filter
 
         return context
@@ -497,10 +576,16 @@ class AdminUserListView(LoginRequiredMixin, SuperAdminRequiredMixin, ListView):
     context_object_name = 'admin_users'
 
     def get_queryset(self):
+        # The profile filter already compiles to an INNER JOIN; only() keeps
+        # password hashes and other unused columns out of the listing
         return User.objects.filter(
             profile__isnull=False,
             is_active=True
-        ).select_related('profile').exclude(id=self.request.user.id)
+        ).select_related('profile').only(
+            'id', 'username', 'email', 'first_name', 'last_name', 'is_active',
+            'last_login', 'date_joined',
+            'profile__role', 'profile__phone_number', 'profile__is_active', 'profile__created_at'
+        ).exclude(id=self.request.user.id)
 
 class AdminUserCreateView(LoginRequiredMixin, SuperAdminRequiredMixin, CreateView):
     form_class = CustomUserCreationForm
@@ -531,11 +616,10 @@ class AdminUserDeleteView(LoginRequiredMixin, SuperAdminRequiredMixin, DeleteVie
     template_name = 'admin_management/admin_user_confirm_delete.html'
     success_url = reverse_lazy('admin_user_list')
 
-    def delete(self, request, *args, **kwargs):
-        user = self.get_object()
-        # Soft delete
-        user.is_active = False
-        user.save()
+    def post(self, request, *args, **kwargs):
+        # Soft delete; DeleteView's own post() would remove the row
+        user = get_object_or_404(User.objects.only('id', 'username'), pk=kwargs['pk'])
+        User.objects.filter(pk=user.pk).update(is_active=False)
         messages.success(request, f'Admin user {user.username} deactivated successfully!')
         return redirect(self.success_url)
 
@@ -555,9 +639,9 @@ class FeeConfigurationView(LoginRequiredMixin, SuperAdminRequiredMixin, FormView
         config.save()
 
         # Update all students' fees based on new configuration
-        for student in Student.objects.filter(is_active=True):
-            student.calculate_total_fee()
-            student.update_fee_status()
+        Student.bulk_refresh_fee_status(
+            Student.objects.filter(is_active=True).values('id')
+        )
 
         messages.success(self.request, 'Fee configuration updated successfully!')
         return super().form_valid(form)
@@ -567,137 +651,221 @@ class FeeConfigurationView(LoginRequiredMixin, SuperAdminRequiredMixin, FormView
         context['config'] = FeeConfiguration.get_instance()
         return context
 
+class FastJsonResponse(HttpResponse):
+    """JsonResponse equivalent that serializes with orjson"""
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(orjson.dumps(data, default=str), **kwargs)
+
 # API Views for AJAX calls
-class StudentSearchAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
+# These are async so an ASGI server can overlap their database waits; every
+# query in them must use the async ORM API (acount, aaggregate, async for).
+class StudentSearchAPIView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
         query = request.GET.get('q', '')
         students = Student.objects.filter(
             Q(name__icontains=query) | Q(contact__icontains=query),
             is_active=True
-        )[:10]
+        ).only('id', 'name', 'contact', 'total_due_amount')[:10]
 
+        # total_due_amount already holds the remaining due kept current by
+        # update_fee_status(), so no per-student fee queries are needed
         results = []
-        for student in students:
+        async for student in students:
             results.append({
                 'id': student.id,
                 'name': student.name,
                 'contact': student.contact,
-                'due_amount': str(student.get_remaining_due())
+                'due_amount': str(student.total_due_amount)
             })
 
-        return JsonResponse({'results': results})
+        return FastJsonResponse({'results': results})
 
-class AttendanceChartAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
+class AttendanceChartAPIView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
         # Generate attendance chart data
         period = request.GET.get('period', 'month')
 
+        labels, present, absent = [], [], []
         if period == 'month':
-            # Last 30 days
+            # Last 30 days, built in a single pass over the grouped rows
             start_date = date.today() - timedelta(days=30)
-            attendance_data = Attendance.objects.filter(
+            async for item in Attendance.objects.filter(
                 date__gte=start_date
             ).values('date').annotate(
                 present=Count('id', filter=Q(status='PRESENT')),
                 absent=Count('id', filter=Q(status='ABSENT'))
-            ).order_by('date')
+            ).order_by('date'):
+                labels.append(item['date'].isoformat())
+                present.append(item['present'])
+                absent.append(item['absent'])
 
         chart_data = {
-            'labels': [item['date'].strftime('%Y-%m-%d') for item in attendance_data],
-            'present': [item['present'] for item in attendance_data],
-            'absent': [item['absent'] for item in attendance_data]
+            'labels': labels,
+            'present': present,
+            'absent': absent
         }
 
-        return JsonResponse(chart_data)
+        return FastJsonResponse(chart_data)
 
-class FeeChartAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
+class FeeChartAPIView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
         # Generate fee collection chart data
         period = request.GET.get('period', 'month')
 
         if period == 'month':
-            # Last 12 months
-            chart_data = []
-            for i in range(12):
-                month_date = date.today().replace(day=1) - timedelta(days=30*i)
-                monthly_collection = FeeTransaction.objects.filter(
-                    payment_date__year=month_date.year,
-                    payment_date__month=month_date.month,
-                    payment_status='COMPLETED'
-                ).aggregate(total=Sum('amount_paid'))['total'] or 0
-
-                chart_data.append({
-                    'month': month_date.strftime('%Y-%m'),
-                    'collection': float(monthly_collection)
-                })
-
-        return JsonResponse({'data': list(reversed(chart_data))})
-
-class DashboardStatsAPIView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
-        # Real-time dashboard statistics
-        stats = {
-            'total_students': Student.objects.filter(is_active=True).count(),
-            'total_revenue': float(FeeTransaction.objects.filter(
+            # Last 12 months, oldest first
+            year, month = date.today().year, date.today().month
+            months = []
+            for _ in range(12):
+                months.append(date(year, month, 1))
+                year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+            months.reverse()
+
+            monthly_collections = {
+                item['month']: item['total']
+                async for item in FeeTransaction.objects.filter(
+                    payment_status='COMPLETED',
+                    payment_date__gte=months[0]
+                ).annotate(
+                    month=TruncMonth('payment_date')
+                ).values('month').annotate(total=Sum('amount_paid')).order_by('month')
+            }
+
+            chart_data = [{
+                'month': month_date.strftime('%Y-%m'),
+                'collection': float(monthly_collections.get(month_date, 0))
+            } for month_date in months]
+
+        return FastJsonResponse({'data': chart_data})
+
+class DashboardStatsAPIView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
+        # Real-time dashboard statistics, shared briefly between polls
+        stats = await cache.aget(DASHBOARD_STATS_CACHE_KEY)
+        if stats is None:
+            student_stats = await Student.objects.filter(is_active=True).aaggregate(
+                total_students=Count('id'),
+                total_pending=Coalesce(Sum('total_due_amount'), Value(Decimal('0.00'))),
+            )
+            revenue = await FeeTransaction.objects.filter(
                 payment_status='COMPLETED'
-            ).aggregate(total=Sum('amount_paid'))['total'] or 0),
-            'total_pending': float(Student.objects.filter(
-                is_active=True
-            ).aggregate(total=Sum('total_due_amount'))['total'] or 0),
-            'today_attendance': Attendance.objects.filter(
-                date=date.today()
-            ).count(),
-        }
-
-        return JsonResponse(stats)
-
-class ExportAttendanceView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
-        # Export attendance data to CSV
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="attendance_report.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(['Date', 'Student Name', 'Shift', 'Status', 'Marked By'])
+            ).aaggregate(total=Coalesce(Sum('amount_paid'), Value(Decimal('0.00'))))
+
+            stats = {
+                'total_students': student_stats['total_students'],
+                'total_revenue': float(revenue['total']),
+                'total_pending': float(student_stats['total_pending']),
+                'today_attendance': await Attendance.objects.filter(
+                    date=date.today()
+                ).acount(),
+            }
+            await cache.aset(DASHBOARD_STATS_CACHE_KEY, stats, DASHBOARD_STATS_CACHE_TIMEOUT)
+
+        return FastJsonResponse(stats)
+
+class Echo:
+    """File-like object whose write() hands the value back, for streaming csv rows"""
+    def write(self, value):
+        return value
+
+def csv_response(filename, header, rows):
+    """Stream header and rows (an async iterable) to the client as a CSV download
+
+    Under ASGI each chunk is sent as it is read. WSGI servers cannot consume
+    an async iterator, so Django collects the whole export there first.
+    """
+    writer = csv.writer(Echo())
+
+    async def lines():
+        yield writer.writerow(header)
+        async for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(lines(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+def pdf_response(title, filename, header, rows, row_height=18):
+    """Render header and rows as a PDF table download"""
+    buffer = BytesIO()
+    data = [header] + [[str(value) for value in row] for row in rows]
+
+    # LongTable with fixed row heights skips measuring every cell, which
+    # makes layout of long tables linear instead of quadratic
+    table = LongTable(data, rowHeights=[row_height] * len(data), repeatRows=1)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+    ]))
+
+    doc = SimpleDocTemplate(buffer, pagesize=A4, title=title)
+    doc.build([Paragraph(title, getSampleStyleSheet()['Title']), Spacer(1, 12), table])
+    buffer.seek(0)
+    return FileResponse(buffer, as_attachment=True, filename=filename)
+
+# Async, like the API views, so the CSV rows can stream from aiterator()
+class ExportAttendanceView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
+        # Export attendance data to CSV, or PDF with ?format=pdf
+        header = ['Date', 'Student Name', 'Shift', 'Status', 'Marked By']
 
         # Get filtered attendance data
         attendance_records = Attendance.objects.select_related(
             'student', 'shift', 'marked_by'
+        ).only(
+            'status', 'student__name', 'shift__name', 'marked_by__username'
+        ).annotate(
+            # ISO date text straight from the database, no per-row formatting
+            date_str=Cast('date', output_field=CharField())
         ).order_by('-date')
 
-        for record in attendance_records:
-            writer.writerow([
-                record.date,
-                record.student.name,
-                record.shift.get_name_display(),
-                record.get_status_display(),
-                record.marked_by.username if record.marked_by else ''
-            ])
-
-        return response
-
-class ExportFeesView(LoginRequiredMixin, AdminRequiredMixin, View):
-    def get(self, request):
-        # Export fee transaction data to CSV
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="fee_transactions.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(['Transaction ID', 'Student Name', 'Amount Paid', 'Payment Date', 'Status', 'Processed By'])
+        rows = ([
+            record.date_str,
+            record.student.name,
+            record.shift.get_name_display(),
+            record.get_status_display(),
+            record.marked_by.username if record.marked_by else ''
+        ] async for record in attendance_records.aiterator(chunk_size=2000))
+
+        if request.GET.get('format') == 'pdf':
+            # The PDF is laid out in one go, so gather the rows first
+            rows = [row async for row in rows]
+            return await sync_to_async(pdf_response)(
+                'Attendance Report', 'attendance_report.pdf', header, rows
+            )
+        return csv_response('attendance_report.csv', header, rows)
+
+class ExportFeesView(AsyncAdminRequiredMixin, View):
+    async def get(self, request):
+        # Export fee transaction data to CSV, or PDF with ?format=pdf
+        header = ['Transaction ID', 'Student Name', 'Amount Paid', 'Payment Date', 'Status', 'Processed By']
 
         # Get filtered transaction data
         transactions = FeeTransaction.objects.select_related(
             'student', 'processed_by'
+        ).only(
+            'transaction_id', 'amount_paid', 'payment_status',
+            'student__name', 'processed_by__username'
+        ).annotate(
+            payment_date_str=Cast('payment_date', output_field=CharField())
         ).order_by('-payment_date')
 
-        for transaction in transactions:
-            writer.writerow([
-                transaction.transaction_id,
-                transaction.student.name,
-                transaction.amount_paid,
-                transaction.payment_date,
-                transaction.get_payment_status_display(),
-                transaction.processed_by.username if transaction.processed_by else ''
-            ])
-
-        return response
+        rows = ([
+            transaction.transaction_id,
+            transaction.student.name,
+            transaction.amount_paid,
+            transaction.payment_date_str,
+            transaction.get_payment_status_display(),
+            transaction.processed_by.username if transaction.processed_by else ''
+        ] async for transaction in transactions.aiterator(chunk_size=2000))
+
+        if request.GET.get('format') == 'pdf':
+            rows = [row async for row in rows]
+            return await sync_to_async(pdf_response)(
+                'Fee Transactions', 'fee_transactions.pdf', header, rows
+            )
+        return csv_response('fee_transactions.csv', header, rows)